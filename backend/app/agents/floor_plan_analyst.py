@@ -5,14 +5,76 @@ Uses Google Gemini Vision for image understanding
 """
 
 import os
-import base64
-from typing import Dict, Any, List, Optional
+import io
+from typing import Dict, Any, List, Optional, Tuple
 import google.generativeai as genai
+from PIL import Image, ImageOps
 from pydantic import BaseModel, Field, field_validator
 
 # Configure Gemini
 genai.configure(api_key=os.getenv('GOOGLE_GEMINI_API_KEY'))
 
+# (connect, read) timeout in seconds for downloading floor plan images by URL
+IMAGE_DOWNLOAD_TIMEOUT = (5, 60)
+
+# PIL format names mapped to the MIME types sent to Gemini
+PIL_MIME_TYPES = {
+    'PNG': 'image/png',
+    'JPEG': 'image/jpeg',
+    'WEBP': 'image/webp',
+    'GIF': 'image/gif',
+}
+
+# Longest side sent to Gemini; dimension labels stay legible well below this
+MAX_IMAGE_DIMENSION = 2048
+
+
+def prepare_image(image_bytes: bytes) -> Tuple[bytes, str]:
+    """
+    Detect a floor plan's MIME type and shrink oversized PNG/JPEG scans
+    
+    PDFs are recognized by their header; anything else is opened once with
+    PIL, which reads the format before decoding any pixels. Scans of floor
+    plans are often 4000px+ on the long side; sending them at
+    MAX_IMAGE_DIMENSION cuts upload size and image tokens without losing the
+    room labels Gemini needs.
+    
+    Args:
+        image_bytes: Raw file data
+    
+    Returns:
+        (image_bytes, mime_type), with the bytes unchanged if already small,
+        not a raster PNG/JPEG, or undecodable (labelled image/png)
+    """
+    if image_bytes.startswith(b'%PDF-'):
+        return image_bytes, 'application/pdf'
+    
+    mime_type = 'image/png'
+    try:
+        with Image.open(io.BytesIO(image_bytes)) as image:
+            mime_type = PIL_MIME_TYPES.get(image.format, mime_type)
+            if mime_type not in ('image/png', 'image/jpeg') or max(image.size) <= MAX_IMAGE_DIMENSION:
+                return image_bytes, mime_type
+            
+            # Re-encoding drops EXIF, so bake in the camera rotation first
+            image = ImageOps.exif_transpose(image)
+            # LANCZOS silently degrades to NEAREST for bilevel and palette
+            # scans, dropping 1px walls and dimension strokes
+            if image.mode == '1':
+                image = image.convert('L')
+            elif image.mode in ('P', 'LA'):
+                image = image.convert('RGBA' if image.has_transparency_data else 'RGB')
+            image.thumbnail((MAX_IMAGE_DIMENSION, MAX_IMAGE_DIMENSION), Image.LANCZOS)
+            output = io.BytesIO()
+            if mime_type == 'image/jpeg':
+                image.convert('RGB').save(output, format='JPEG', quality=90)
+            else:
+                image.save(output, format='PNG')
+            return output.getvalue(), mime_type
+    except Exception as e:
+        print(f"Floor plan preprocessing skipped: {e}")
+        return image_bytes, mime_type
+
 
 # ================================
 # Structured Output Schemas
@@ -138,23 +200,21 @@ Respond with a JSON object matching this exact structure:
 """
         
         try:
-            # Prepare the image for Gemini
-            if image_bytes:
-                # Upload bytes directly
-                image_part = {
-                    'mime_type': 'image/png',
-                    'data': base64.b64encode(image_bytes).decode('utf-8')
-                }
-                response = self.model.generate_content([prompt, image_part])
-            else:
-                # Use URL (Gemini will fetch it)
+            # Download the image if we were only given a URL
+            if not image_bytes:
                 import requests
-                response_data = requests.get(image_url).content
-                image_part = {
-                    'mime_type': 'image/png',
-                    'data': base64.b64encode(response_data).decode('utf-8')
-                }
-                response = self.model.generate_content([prompt, image_part])
+                image_response = requests.get(image_url, timeout=IMAGE_DOWNLOAD_TIMEOUT)
+                image_response.raise_for_status()
+                image_bytes = image_response.content
+            
+            image_bytes, mime_type = prepare_image(image_bytes)
+            
+            # Pass raw bytes; an encoded string would just be decoded back by the SDK
+            image_part = {
+                'mime_type': mime_type,
+                'data': image_bytes
+            }
+            response = self.model.generate_content([prompt, image_part])
             
             # Extract JSON from response
             response_text = response.text.strip()
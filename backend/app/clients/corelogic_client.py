@@ -4,28 +4,398 @@ Handles OAuth2 authentication and API requests to CoreLogic Property Data API
 """
 
 import os
+import re
+import copy
 import time
-from typing import Dict, Any, List, Optional
+import random
+import asyncio
+import hashlib
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, Any, List, Optional, Tuple
+import httpx
 import requests
-from datetime import datetime, timedelta
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional, stdlib json still works
+    orjson = None
+
+
+# ================================
+# Exceptions
+# ================================
+
+class CoreLogicError(Exception):
+    """
+    Base error for CoreLogic API failures
+    
+    Attributes:
+        status_code: HTTP status returned by CoreLogic (None for network errors)
+        retry_after: Seconds to wait before retrying, from the Retry-After header
+    """
+    
+    def __init__(self, message: str, status_code: Optional[int] = None, retry_after: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class CoreLogicNotFound(CoreLogicError):
+    """Property, comps, or resource not found"""
+
+
+class CoreLogicAuthError(CoreLogicError):
+    """Credentials rejected or access token invalid"""
+
+
+class CoreLogicRateLimited(CoreLogicError):
+    """API quota or rate limit exceeded (retriable after retry_after seconds)"""
+
+
+class CoreLogicUnavailable(CoreLogicError):
+    """Circuit breaker is open after repeated failures; failing fast (retriable after retry_after seconds)"""
+
+
+# Sent on every request. Accept-Encoding is left to requests/httpx, which
+# already advertise every compression scheme they can decode
+_DEFAULT_HEADERS = {
+    'Accept': 'application/json'
+}
+
+
+def _json(response) -> Any:
+    """Decode a JSON response body, using orjson on the raw bytes when available"""
+    try:
+        if orjson is None:
+            return response.json()
+        return orjson.loads(response.content)
+    except ValueError as e:
+        raise CoreLogicError(f"CoreLogic API returned invalid JSON: {str(e)}")
+
+
+# Transient network failures retried by CoreLogicClient._make_request
+_NETWORK_ERRORS = (requests.exceptions.Timeout, requests.exceptions.ConnectionError)
+
+# Total seconds urllib3 may sleep (Retry-After or backoff) across all status
+# retries of a single request
+MAX_RETRY_AFTER = 10
+
+
+class _CappedRetry(Retry):
+    """
+    urllib3 Retry whose sleeps share one MAX_RETRY_AFTER budget per request
+    
+    A server-sent Retry-After can't park a worker for hours, and a run of
+    retries can't add up to minutes. Once the budget is spent the failed
+    response is handed back to the caller instead of being retried.
+    """
+    
+    def __init__(self, *args, sleep_budget: float = MAX_RETRY_AFTER, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sleep_budget = sleep_budget
+    
+    def new(self, **kw) -> '_CappedRetry':
+        # urllib3 derives a new Retry per attempt; carry over what's left of the budget
+        kw.setdefault('sleep_budget', self.sleep_budget)
+        return super().new(**kw)
+    
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if self.sleep_budget <= 0 or not super().is_retry(method, status_code, has_retry_after):
+            return False
+        # Hand back a response that would open the circuit rather than retrying past it
+        return not (_is_outage(status_code) and CoreLogicClient._failures_left() <= 1)
+    
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        # Every retried 429/5xx counts toward the circuit breaker; the final
+        # response is recorded by the caller
+        if response is not None and _is_outage(response.status):
+            CoreLogicClient._record_result(False)
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+    
+    def sleep(self, response=None):
+        delay = None
+        if self.respect_retry_after_header and response is not None:
+            delay = self.get_retry_after(response)
+        if not delay:
+            delay = self.get_backoff_time()
+        
+        delay = min(delay, self.sleep_budget)
+        self.sleep_budget -= delay
+        if delay > 0:
+            time.sleep(delay)
+
+
+def _parse_retry_after(value: Optional[str]) -> int:
+    """Parse a Retry-After header given in seconds, defaulting to 0"""
+    try:
+        return max(int(value), 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _error_for_status(status_code: int, text: str, retry_after: Optional[str] = None) -> CoreLogicError:
+    """Map a failed HTTP status onto the matching CoreLogicError subclass"""
+    if status_code == 404:
+        return CoreLogicNotFound("Property not found in CoreLogic database", status_code=status_code)
+    if status_code == 401:
+        return CoreLogicAuthError("Authentication failed. Token expired or invalid.", status_code=status_code)
+    if status_code == 403:
+        return CoreLogicAuthError("Access to CoreLogic resource forbidden", status_code=status_code)
+    if status_code == 429:
+        return CoreLogicRateLimited(
+            "CoreLogic API rate limit exceeded",
+            status_code=status_code,
+            retry_after=_parse_retry_after(retry_after)
+        )
+    return CoreLogicError(f"CoreLogic API error: {status_code} - {text}", status_code=status_code)
+
+
+def _is_outage(status_code: int) -> bool:
+    """Whether a status means CoreLogic itself is struggling (counts toward the circuit breaker)"""
+    return status_code == 429 or status_code >= 500
+
+
+def _token_error_for_status(status_code: int, text: str, retry_after: Optional[str] = None) -> CoreLogicError:
+    """
+    Map a failed /oauth/token status: rejected credentials are terminal,
+    rate limits and server errors keep their retriable classes
+    """
+    if status_code in (400, 401, 403):
+        return CoreLogicAuthError(f"CoreLogic authentication failed: {status_code} - {text}", status_code=status_code)
+    if _is_outage(status_code):
+        return _error_for_status(status_code, text, retry_after)
+    return CoreLogicError(f"CoreLogic authentication error: {status_code} - {text}", status_code=status_code)
+
+
+def _credentials_key(consumer_key: str, consumer_secret: str) -> str:
+    """Hash credentials into a stable key for the shared token cache"""
+    return hashlib.sha256(f"{consumer_key}:{consumer_secret}".encode()).hexdigest()
+
+
+def _token_expiry(expires_in: int) -> float:
+    """
+    Monotonic deadline after which a token should be refreshed
+    
+    Includes a 5-minute safety buffer and +/-60s jitter so workers don't all
+    refresh at the same instant. time.monotonic() is cheap to compare on every
+    call and unaffected by wall-clock (NTP) adjustments.
+    """
+    return time.monotonic() + expires_in - 300 + random.uniform(-60, 60)
+
+
+# ================================
+# Response Normalization
+# ================================
+# Shared by CoreLogicClient and AsyncCoreLogicClient
+
+# (output field, path into the CoreLogic record) - walked by _pluck
+_SEARCH_FIELDS = (
+    ('clip_id', ('clipId',)),
+    ('address', ('address', 'oneLine')),
+    ('city', ('address', 'locality')),
+    ('state', ('address', 'countrySubd')),
+    ('zip', ('address', 'postal1')),
+    ('county', ('address', 'county')),
+    ('property_type', ('property', 'propertyType')),
+    ('year_built', ('building', 'yearBuilt')),
+    ('bedrooms', ('building', 'rooms', 'beds')),
+    ('bathrooms', ('building', 'rooms', 'bathsTotal')),
+    ('square_feet', ('building', 'size', 'universalSize')),
+    ('lot_size', ('lot', 'lotSize1')),
+    ('last_sale_date', ('sale', 'mostRecentDate')),
+    ('last_sale_price', ('sale', 'mostRecentPrice')),
+    ('assessed_value', ('assessment', 'total', 'assdTtlValue'))
+)
+
+_COMP_FIELDS = (
+    ('clip_id', ('clipId',)),
+    ('address', ('address', 'oneLine')),
+    ('distance_miles', ('distance',)),
+    ('bedrooms', ('building', 'rooms', 'beds')),
+    ('bathrooms', ('building', 'rooms', 'bathsTotal')),
+    ('square_feet', ('building', 'size', 'universalSize')),
+    ('year_built', ('building', 'yearBuilt')),
+    ('last_sale_date', ('sale', 'mostRecentDate')),
+    ('last_sale_price', ('sale', 'mostRecentPrice')),
+    ('similarity_score', ('similarityScore',))
+)
+
+_COMP_DEFAULTS = {'similarity_score': 0}
+
+
+def _pluck(record: Any, path: Tuple[str, ...]) -> Any:
+    """Walk a key path through nested dicts, returning None at the first gap"""
+    for key in path:
+        if not isinstance(record, dict):
+            return None
+        record = record.get(key)
+        if record is None:
+            return None
+    return record
+
+
+def _extract(record: Dict[str, Any], fields: Tuple[Tuple[str, Tuple[str, ...]], ...],
+             defaults: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Build a flat dict from a field table, filling None values from defaults"""
+    row = {name: _pluck(record, path) for name, path in fields}
+    if defaults:
+        for name, value in defaults.items():
+            if row[name] is None:
+                row[name] = value
+    return row
+
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+@functools.lru_cache(maxsize=8192)
+def _search_cache_key(address: str, city: Optional[str], state: Optional[str],
+                      zip_code: Optional[str]) -> Tuple[str, ...]:
+    """Normalize address parts so '123 Main St' and ' 123  main st ' share a cache entry"""
+    return tuple(
+        _WHITESPACE.sub(' ', part.strip().upper()) if part else ''
+        for part in (address, city, state, zip_code)
+    )
+
+
+def _comps_params(radius_miles: float, max_results: int) -> Dict[str, Any]:
+    """Query parameters for the comps endpoint"""
+    return {
+        'radius': radius_miles,
+        'limit': max_results,
+        'sort': 'distance'  # Sort by proximity
+    }
+
+
+def _search_params(address: str, city: Optional[str], state: Optional[str],
+                   zip_code: Optional[str]) -> Dict[str, Any]:
+    """Query parameters for the property search endpoint"""
+    params = {'address': address}
+    
+    if city:
+        params['city'] = city
+    if state:
+        params['state'] = state
+    if zip_code:
+        params['zip'] = zip_code
+    
+    return params
+
+
+def _normalize_search(result: Dict[str, Any], address: str) -> Dict[str, Any]:
+    """Normalize the first property of a search response"""
+    if not result.get('properties'):
+        raise CoreLogicNotFound(f"No property found for address: {address}")
+    
+    # Return first matching property
+    property_data = result['properties'][0]
+    
+    return _extract(property_data, _SEARCH_FIELDS)
+
+
+def _normalize_details(result: Dict[str, Any], clip_id: str) -> Dict[str, Any]:
+    """Normalize a property details response"""
+    return {
+        'clip_id': clip_id,
+        'property': result.get('property', {}),
+        'building': result.get('building', {}),
+        'lot': result.get('lot', {}),
+        'owner': result.get('owner', {}),
+        'assessment': result.get('assessment', {}),
+        'sale': result.get('sale', {}),
+        'mortgage': result.get('mortgage', {}),
+        'tax': result.get('tax', {})
+    }
+
+
+def _normalize_comps(result: Dict[str, Any], clip_id: str) -> List[Dict[str, Any]]:
+    """Normalize a comps response"""
+    if not result.get('comparables'):
+        raise CoreLogicNotFound(f"No comparable properties found for CLIP ID: {clip_id}")
+    
+    return [_extract(comp, _COMP_FIELDS, _COMP_DEFAULTS) for comp in result['comparables']]
+
+
+def _normalize_avm(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize an AVM response"""
+    avm_data = result.get('avm', {})
+    
+    return {
+        'estimated_value': avm_data.get('amount'),
+        'confidence_score': avm_data.get('confidenceScore'),
+        'value_range_low': avm_data.get('valueLow'),
+        'value_range_high': avm_data.get('valueHigh'),
+        'as_of_date': avm_data.get('asOfDate')
+    }
+
+
+# ================================
+# Sync Client
+# ================================
 
 class CoreLogicClient:
     """
     Client for CoreLogic Property Data API
     
     Features:
-    - OAuth2 token management with automatic refresh
+    - Pooled keep-alive connections via a process-wide HTTPAdapter
+    - OAuth2 token management with automatic refresh, shared process-wide
+      across instances with the same credentials
     - Property search by address
     - Property details retrieval by CLIP ID
     - Comparable properties (comps) search
     - Comprehensive error handling
+    - Process-wide TTL caches for search (24h), details (24h) and AVM (6h)
+    - Circuit breaker that fails fast during CoreLogic outages
     """
     
     # Default to production API (can be overridden with CORELOGIC_API_URL env var)
     BASE_URL = os.getenv('CORELOGIC_API_URL', 'https://api-prod.corelogic.com') + "/property/v1"
     AUTH_URL = os.getenv('CORELOGIC_API_URL', 'https://api-prod.corelogic.com') + "/oauth/token"
     
+    # Attempts for timeouts/connection errors (status retries are handled by urllib3)
+    MAX_ATTEMPTS = 5
+    
+    # Threads used to enrich comps with details; keep <= the adapter's pool_maxsize
+    # so every worker gets its own keep-alive connection
+    ENRICH_WORKERS = 8
+    
+    # Overall wait (seconds) for all comp details; a single lookup can exceed this
+    # under the full retry budget, in which case that comp just gets details=None
+    ENRICH_TIMEOUT = 60
+    
+    # Circuit breaker shared process-wide: after CIRCUIT_THRESHOLD consecutive
+    # outage failures, fail fast for CIRCUIT_COOLDOWN seconds, then let one probe through
+    CIRCUIT_THRESHOLD = 5
+    CIRCUIT_COOLDOWN = 30
+    _consecutive_failures = 0
+    _circuit_open_until = 0.0
+    _circuit_lock = threading.Lock()
+    
+    # Process-wide OAuth tokens keyed by hashed credentials: key -> (token, expires_at).
+    # _token_lock only guards these dicts; the /oauth/token call itself runs under
+    # a per-credentials refresh lock so it never blocks unrelated callers.
+    _token_cache: Dict[str, Tuple[str, float]] = {}
+    _refresh_locks: Dict[str, threading.Lock] = {}
+    _token_lock = threading.Lock()
+    
+    # Process-wide connection pool mounted on every instance's session, so the
+    # short-lived clients built per Celery task reuse warm TCP+TLS connections
+    _adapter: Optional[HTTPAdapter] = None
+    _adapter_lock = threading.Lock()
+    _warmed_up = False
+    
+    # Process-wide response caches; property data and AVMs change at most daily
+    _search_cache = TTLCache(maxsize=4096, ttl=86400)
+    _details_cache = TTLCache(maxsize=4096, ttl=86400)
+    _avm_cache = TTLCache(maxsize=4096, ttl=21600)
+    _cache_lock = threading.RLock()
+    
     def __init__(self, consumer_key: Optional[str] = None, consumer_secret: Optional[str] = None):
         """
         Initialize CoreLogic API client
@@ -46,8 +416,71 @@ class CoreLogicClient:
             raise ValueError("CoreLogic credentials not found. Set CORELOGIC_CONSUMER_KEY and CORELOGIC_CONSUMER_SECRET")
         
         self.access_token = None
-        self.token_expires_at = None
+        self._token_expiry_mono = 0.0
+        self._credentials_key = _credentials_key(self.consumer_key, self.consumer_secret)
+        
+        # The session only carries this instance's headers; its connections
+        # come from the process-wide adapter
+        self._session = requests.Session()
+        self._session.headers.update(_DEFAULT_HEADERS)
+        self._session.mount('https://', self._get_adapter())
+        
+        # Created on first enriched comps lookup
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
+        # Opt-in: fetch a token and open a pooled connection in the background so
+        # the first real request doesn't pay for OAuth + the TLS handshake. Both
+        # are process-wide, so only the first client in the process does this.
+        if os.getenv('CORELOGIC_WARMUP') == '1' and self._claim_warm_up():
+            threading.Thread(target=self._warm_up, daemon=True).start()
+        
+    @classmethod
+    def _claim_warm_up(cls) -> bool:
+        """Return True for the first caller in this process, False afterwards"""
+        with CoreLogicClient._adapter_lock:
+            if CoreLogicClient._warmed_up:
+                return False
+            CoreLogicClient._warmed_up = True
+            return True
+    
+    def _warm_up(self):
+        """Pre-populate the shared token cache and connection pool (best effort)"""
+        try:
+            self._get_access_token()
+            self._session.head(self.BASE_URL, timeout=5)
+        except Exception as e:
+            print(f"CoreLogic warm-up skipped: {e}")
+    
+    @classmethod
+    def _get_adapter(cls) -> HTTPAdapter:
+        """
+        Lazily create the shared pooled adapter
         
+        urllib3 retries 429/5xx with backoff (honoring Retry-After), sleeping at
+        most MAX_RETRY_AFTER in total per request; connect/read failures are
+        left to the jittered loop in _make_request.
+        """
+        with CoreLogicClient._adapter_lock:
+            if CoreLogicClient._adapter is None:
+                retry = _CappedRetry(
+                    total=5,
+                    connect=0,
+                    read=0,
+                    backoff_factor=0.5,
+                    status_forcelist=(429, 500, 502, 503, 504),
+                    allowed_methods=frozenset(['GET', 'POST']),
+                    respect_retry_after_header=True,
+                    raise_on_status=False
+                )
+                CoreLogicClient._adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+            return CoreLogicClient._adapter
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Lazily create the thread pool used for concurrent detail lookups"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.ENRICH_WORKERS)
+        return self._executor
+    
     def _get_access_token(self) -> str:
         """
         Get OAuth2 access token (with caching and auto-refresh)
@@ -56,35 +489,144 @@ class CoreLogicClient:
             Valid access token
         
         Raises:
-            requests.HTTPError: If authentication fails
+            CoreLogicAuthError: If credentials are rejected (400/401/403)
+            CoreLogicRateLimited: On 429 from the token endpoint
+            CoreLogicError: On 5xx, timeouts or connection failures
         """
         # Return cached token if still valid
-        if self.access_token and self.token_expires_at:
-            if datetime.now() < self.token_expires_at - timedelta(minutes=5):
-                return self.access_token
+        if self.access_token and time.monotonic() < self._token_expiry_mono:
+            return self.access_token
         
-        # Request new token
-        try:
-            response = requests.post(
-                self.AUTH_URL,
-                auth=(self.consumer_key, self.consumer_secret),
-                data={'grant_type': 'client_credentials'},
-                headers={'Content-Type': 'application/x-www-form-urlencoded'},
-                timeout=30
-            )
-            response.raise_for_status()
+        # Lock so concurrent clients with the same credentials only fetch one token
+        with self._refresh_lock(self._credentials_key):
+            cached = CoreLogicClient._token_cache.get(self._credentials_key)
+            if cached and time.monotonic() < cached[1]:
+                self._set_token(*cached)
+                return self.access_token
             
-            token_data = response.json()
-            self.access_token = token_data['access_token']
+            # Request new token
+            try:
+                response = self._session.post(
+                    self.AUTH_URL,
+                    auth=(self.consumer_key, self.consumer_secret),
+                    data={'grant_type': 'client_credentials'},
+                    headers={'Content-Type': 'application/x-www-form-urlencoded'},
+                    timeout=30
+                )
+                response.raise_for_status()
+                
+                token_data = _json(response)
+                
+                # Calculate expiry time (usually 3600 seconds)
+                expires_in = token_data.get('expires_in', 3600)
+                self._set_token(token_data['access_token'], _token_expiry(expires_in))
+                with CoreLogicClient._token_lock:
+                    CoreLogicClient._token_cache[self._credentials_key] = (self.access_token, self._token_expiry_mono)
+                
+                return self.access_token
+                
+            except requests.exceptions.HTTPError as e:
+                if _is_outage(e.response.status_code):
+                    self._record_result(False)
+                raise _token_error_for_status(e.response.status_code, e.response.text, e.response.headers.get('Retry-After'))
+            except requests.exceptions.RequestException as e:
+                # Network failures are counted once by _make_request after its retries
+                raise CoreLogicError(f"CoreLogic authentication request failed: {str(e)}") from e
+    
+    @classmethod
+    def _refresh_lock(cls, key: str) -> threading.Lock:
+        """Lock serializing token refreshes for one set of credentials"""
+        with CoreLogicClient._token_lock:
+            return CoreLogicClient._refresh_locks.setdefault(key, threading.Lock())
+    
+    def _set_token(self, token: str, expires_at: float):
+        """Adopt a token on this instance and authenticate the session with it"""
+        self.access_token = token
+        self._token_expiry_mono = expires_at
+        self._session.headers['Authorization'] = f'Bearer {token}'
+    
+    @classmethod
+    def _cache_get(cls, cache: TTLCache, key: Any) -> Optional[Any]:
+        """Return a copy of a cached response so callers can't mutate the shared entry"""
+        with cls._cache_lock:
+            value = cache.get(key)
+        return copy.deepcopy(value) if value is not None else None
+    
+    @classmethod
+    def _cache_put(cls, cache: TTLCache, key: Any, value: Any) -> Any:
+        """Store a copy of a normalized response and hand back the original"""
+        with cls._cache_lock:
+            cache[key] = copy.deepcopy(value)
+        return value
+    
+    @classmethod
+    def clear_cache(cls):
+        """Drop all cached search, details and AVM responses"""
+        with cls._cache_lock:
+            cls._search_cache.clear()
+            cls._details_cache.clear()
+            cls._avm_cache.clear()
+    
+    @classmethod
+    def invalidate_token_cache(cls, key: Optional[str] = None):
+        """
+        Evict a shared token (or all tokens when key is None)
+        
+        Args:
+            key: Hashed credentials key of the entry to evict
+        """
+        with cls._token_lock:
+            if key is None:
+                cls._token_cache.clear()
+            else:
+                cls._token_cache.pop(key, None)
+    
+    @classmethod
+    def _check_circuit(cls):
+        """
+        Fail fast while the circuit breaker is open
+        
+        Raises:
+            CoreLogicUnavailable: If the cooldown after repeated failures hasn't elapsed
+        """
+        with CoreLogicClient._circuit_lock:
+            if CoreLogicClient._consecutive_failures < cls.CIRCUIT_THRESHOLD:
+                return
             
-            # Calculate expiry time (usually 3600 seconds)
-            expires_in = token_data.get('expires_in', 3600)
-            self.token_expires_at = datetime.now() + timedelta(seconds=expires_in)
+            remaining = CoreLogicClient._circuit_open_until - time.monotonic()
+            if remaining > 0:
+                raise CoreLogicUnavailable(
+                    "CoreLogic API temporarily unavailable after repeated failures",
+                    retry_after=int(remaining) + 1
+                )
             
-            return self.access_token
+            # Half-open: this caller probes, everyone else waits out another cooldown
+            CoreLogicClient._circuit_open_until = time.monotonic() + cls.CIRCUIT_COOLDOWN
+    
+    @classmethod
+    def _record_result(cls, success: bool):
+        """Close the circuit on success; open it once failures reach CIRCUIT_THRESHOLD"""
+        with CoreLogicClient._circuit_lock:
+            if success:
+                CoreLogicClient._consecutive_failures = 0
+                return
             
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"CoreLogic authentication failed: {str(e)}")
+            CoreLogicClient._consecutive_failures += 1
+            if CoreLogicClient._consecutive_failures >= cls.CIRCUIT_THRESHOLD:
+                CoreLogicClient._circuit_open_until = time.monotonic() + cls.CIRCUIT_COOLDOWN
+    
+    @classmethod
+    def _failures_left(cls) -> int:
+        """Outage failures still allowed before the circuit opens"""
+        with CoreLogicClient._circuit_lock:
+            return max(cls.CIRCUIT_THRESHOLD - CoreLogicClient._consecutive_failures, 0)
+    
+    @classmethod
+    def reset_circuit(cls):
+        """Close the circuit breaker and forget recorded failures"""
+        with CoreLogicClient._circuit_lock:
+            CoreLogicClient._consecutive_failures = 0
+            CoreLogicClient._circuit_open_until = 0.0
     
     def _make_request(self, endpoint: str, params: Optional[Dict] = None, method: str = 'GET') -> Dict[str, Any]:
         """
@@ -98,44 +640,73 @@ class CoreLogicClient:
         Returns:
             API response as dictionary
         
+        Retries:
+            - 429/5xx: up to 5 times inside urllib3 with exponential backoff,
+              sleeping no more than MAX_RETRY_AFTER in total; each retried
+              response counts toward the circuit breaker
+            - Timeouts/connection errors (including a token refresh): up to
+              MAX_ATTEMPTS with jittered sleeps
+            - 401: once, after evicting the shared token
+        
         Raises:
-            requests.HTTPError: If request fails
+            CoreLogicNotFound: On 404
+            CoreLogicAuthError: On 401/403
+            CoreLogicRateLimited: On 429
+            CoreLogicUnavailable: While the circuit breaker is open
+            CoreLogicError: On any other HTTP or network failure
         """
-        token = self._get_access_token()
-        url = f"{self.BASE_URL}/{endpoint}"
+        if method not in ('GET', 'POST'):
+            raise ValueError(f"Unsupported HTTP method: {method}")
         
-        headers = {
-            'Authorization': f'Bearer {token}',
-            'Accept': 'application/json'
-        }
+        self._check_circuit()
         
-        try:
-            if method == 'GET':
-                response = requests.get(url, headers=headers, params=params, timeout=30)
-            elif method == 'POST':
-                response = requests.post(url, headers=headers, json=params, timeout=30)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-            
-            response.raise_for_status()
-            return response.json()
+        url = f"{self.BASE_URL}/{endpoint}"
+        attempt = 0
+        reauthenticated = False
+        
+        while True:
+            try:
+                self._get_access_token()
+                
+                if method == 'GET':
+                    response = self._session.get(url, params=params, timeout=30)
+                else:
+                    response = self._session.post(url, json=params, timeout=30)
+                
+                response.raise_for_status()
+                self._record_result(True)
+                return _json(response)
+                
+            except requests.exceptions.HTTPError as e:
+                self._record_result(not _is_outage(e.response.status_code))
+                if e.response.status_code == 401:
+                    # Token might be invalid, clear cache and retry once with a fresh one
+                    self.access_token = None
+                    self._token_expiry_mono = 0.0
+                    CoreLogicClient.invalidate_token_cache(self._credentials_key)
+                    if not reauthenticated:
+                        reauthenticated = True
+                        continue
+                raise _error_for_status(e.response.status_code, e.response.text, e.response.headers.get('Retry-After'))
+            except CoreLogicError as e:
+                # A token refresh that timed out or lost its connection is retried like the data call
+                if not isinstance(e.__cause__, _NETWORK_ERRORS):
+                    raise
+                network_error = e.__cause__
+            except _NETWORK_ERRORS as e:
+                network_error = e
+            except requests.exceptions.RequestException as e:
+                self._record_result(False)
+                raise CoreLogicError(f"CoreLogic API request failed: {str(e)}")
             
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 404:
-                raise Exception("Property not found in CoreLogic database")
-            elif e.response.status_code == 401:
-                # Token might be invalid, clear cache and retry once
-                self.access_token = None
-                self.token_expires_at = None
-                raise Exception("Authentication failed. Token expired or invalid.")
-            elif e.response.status_code == 429:
-                raise Exception("CoreLogic API rate limit exceeded")
-            else:
-                raise Exception(f"CoreLogic API error: {e.response.status_code} - {e.response.text}")
-        except requests.exceptions.Timeout:
-            raise Exception("CoreLogic API request timed out")
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"CoreLogic API request failed: {str(e)}")
+            attempt += 1
+            if attempt >= self.MAX_ATTEMPTS:
+                self._record_result(False)
+                if isinstance(network_error, requests.exceptions.Timeout):
+                    raise CoreLogicError("CoreLogic API request timed out")
+                raise CoreLogicError(f"CoreLogic API request failed: {str(network_error)}")
+            # Linear backoff with jitter between transient network failures
+            time.sleep(random.uniform(2, 4) * attempt)
     
     def search_property(self, address: str, city: Optional[str] = None, 
                        state: Optional[str] = None, zip_code: Optional[str] = None) -> Dict[str, Any]:
@@ -168,43 +739,18 @@ class CoreLogicClient:
             }
         
         Raises:
-            Exception: If property not found or API error
+            CoreLogicNotFound: If no property matches the address
+            CoreLogicError: On API error
         """
-        params = {'address': address}
-        
-        if city:
-            params['city'] = city
-        if state:
-            params['state'] = state
-        if zip_code:
-            params['zip'] = zip_code
+        key = _search_cache_key(address, city, state, zip_code)
+        cached = self._cache_get(self._search_cache, key)
+        if cached is not None:
+            return cached
         
+        params = _search_params(address, city, state, zip_code)
         result = self._make_request('search', params=params)
         
-        # Extract and normalize property data
-        if not result.get('properties'):
-            raise Exception(f"No property found for address: {address}")
-        
-        # Return first matching property
-        property_data = result['properties'][0]
-        
-        return {
-            'clip_id': property_data.get('clipId'),
-            'address': property_data.get('address', {}).get('oneLine'),
-            'city': property_data.get('address', {}).get('locality'),
-            'state': property_data.get('address', {}).get('countrySubd'),
-            'zip': property_data.get('address', {}).get('postal1'),
-            'county': property_data.get('address', {}).get('county'),
-            'property_type': property_data.get('property', {}).get('propertyType'),
-            'year_built': property_data.get('building', {}).get('yearBuilt'),
-            'bedrooms': property_data.get('building', {}).get('rooms', {}).get('beds'),
-            'bathrooms': property_data.get('building', {}).get('rooms', {}).get('bathsTotal'),
-            'square_feet': property_data.get('building', {}).get('size', {}).get('universalSize'),
-            'lot_size': property_data.get('lot', {}).get('lotSize1'),
-            'last_sale_date': property_data.get('sale', {}).get('mostRecentDate'),
-            'last_sale_price': property_data.get('sale', {}).get('mostRecentPrice'),
-            'assessed_value': property_data.get('assessment', {}).get('total', {}).get('assdTtlValue')
-        }
+        return self._cache_put(self._search_cache, key, _normalize_search(result, address))
     
     def get_property_details(self, clip_id: str) -> Dict[str, Any]:
         """
@@ -222,24 +768,19 @@ class CoreLogicClient:
             - Mortgage information
         
         Raises:
-            Exception: If property not found or API error
+            CoreLogicNotFound: If property not found
+            CoreLogicError: On API error
         """
+        cached = self._cache_get(self._details_cache, clip_id)
+        if cached is not None:
+            return cached
+        
         result = self._make_request(f'property/{clip_id}')
         
-        return {
-            'clip_id': clip_id,
-            'property': result.get('property', {}),
-            'building': result.get('building', {}),
-            'lot': result.get('lot', {}),
-            'owner': result.get('owner', {}),
-            'assessment': result.get('assessment', {}),
-            'sale': result.get('sale', {}),
-            'mortgage': result.get('mortgage', {}),
-            'tax': result.get('tax', {})
-        }
+        return self._cache_put(self._details_cache, clip_id, _normalize_details(result, clip_id))
     
     def get_comparables(self, clip_id: str, radius_miles: float = 0.5, 
-                       max_results: int = 10) -> List[Dict[str, Any]]:
+                       max_results: int = 10, enrich: bool = False) -> List[Dict[str, Any]]:
         """
         Get comparable properties (comps) for valuation
         
@@ -247,6 +788,7 @@ class CoreLogicClient:
             clip_id: Subject property CLIP ID
             radius_miles: Search radius in miles (default 0.5)
             max_results: Maximum number of comps to return (default 10)
+            enrich: Also fetch full property details for each comp, concurrently
         
         Returns:
             List of comparable properties with:
@@ -254,39 +796,45 @@ class CoreLogicClient:
             - Distance from subject property
             - Sold date and price
             - Similarity score
+            - details: get_property_details() result when enrich=True
+              (None if that comp's lookup failed)
         
         Raises:
-            Exception: If no comps found or API error
+            CoreLogicNotFound: If no comps found
+            CoreLogicError: On API error
         """
-        params = {
-            'radius': radius_miles,
-            'limit': max_results,
-            'sort': 'distance'  # Sort by proximity
-        }
-        
+        params = _comps_params(radius_miles, max_results)
         result = self._make_request(f'property/{clip_id}/comps', params=params)
         
-        if not result.get('comparables'):
-            raise Exception(f"No comparable properties found for CLIP ID: {clip_id}")
-        
-        # Normalize comp data
-        comps = []
-        for comp in result['comparables']:
-            comps.append({
-                'clip_id': comp.get('clipId'),
-                'address': comp.get('address', {}).get('oneLine'),
-                'distance_miles': comp.get('distance'),
-                'bedrooms': comp.get('building', {}).get('rooms', {}).get('beds'),
-                'bathrooms': comp.get('building', {}).get('rooms', {}).get('bathsTotal'),
-                'square_feet': comp.get('building', {}).get('size', {}).get('universalSize'),
-                'year_built': comp.get('building', {}).get('yearBuilt'),
-                'last_sale_date': comp.get('sale', {}).get('mostRecentDate'),
-                'last_sale_price': comp.get('sale', {}).get('mostRecentPrice'),
-                'similarity_score': comp.get('similarityScore', 0)
-            })
-        
+        comps = _normalize_comps(result, clip_id)
+        if enrich:
+            self._enrich_comps(comps)
         return comps
     
+    def _enrich_comps(self, comps: List[Dict[str, Any]]):
+        """Attach property details to each comp, fetching them in parallel"""
+        executor = self._get_executor()
+        futures = [
+            executor.submit(self.get_property_details, comp['clip_id']) if comp.get('clip_id') else None
+            for comp in comps
+        ]
+        
+        # One shared deadline so N slow lookups can't add up to N timeouts
+        deadline = time.monotonic() + self.ENRICH_TIMEOUT
+        for comp, future in zip(comps, futures):
+            if future is None:
+                comp['details'] = None
+                continue
+            try:
+                comp['details'] = future.result(timeout=max(deadline - time.monotonic(), 0))
+            except FutureTimeoutError:
+                future.cancel()
+                print(f"CoreLogic details lookup timed out for comp {comp['clip_id']}")
+                comp['details'] = None
+            except CoreLogicError as e:
+                print(f"CoreLogic details lookup failed for comp {comp['clip_id']}: {e}")
+                comp['details'] = None
+    
     def estimate_value(self, clip_id: str) -> Dict[str, Any]:
         """
         Get automated valuation model (AVM) estimate
@@ -304,16 +852,269 @@ class CoreLogicClient:
             }
         
         Raises:
-            Exception: If AVM unavailable or API error
+            CoreLogicError: If AVM unavailable or API error
         """
+        cached = self._cache_get(self._avm_cache, clip_id)
+        if cached is not None:
+            return cached
+        
         result = self._make_request(f'property/{clip_id}/avm')
         
-        avm_data = result.get('avm', {})
+        return self._cache_put(self._avm_cache, clip_id, _normalize_avm(result))
+
+
+# ================================
+# Async Client
+# ================================
+
+class AsyncCoreLogicClient:
+    """
+    Async client for CoreLogic Property Data API
+    
+    Mirrors CoreLogicClient's read methods as coroutines so independent
+    lookups (details, AVM, comps) for one or many CLIP IDs run concurrently
+    over a single keep-alive connection pool, multiplexed over HTTP/2 when
+    the server supports it.
+    
+    Usage:
+        async with AsyncCoreLogicClient() as client:
+            bundle = await client.bundle(clip_id)
+    """
+    
+    def __init__(self, consumer_key: Optional[str] = None, consumer_secret: Optional[str] = None):
+        """
+        Initialize async CoreLogic API client
+        
+        Args:
+            consumer_key: CoreLogic API consumer key (or from CORELOGIC_CONSUMER_KEY env var)
+            consumer_secret: CoreLogic API consumer secret (or from CORELOGIC_CONSUMER_SECRET env var)
+        """
+        self.consumer_key = consumer_key or os.getenv('CORELOGIC_CONSUMER_KEY')
+        self.consumer_secret = consumer_secret or os.getenv('CORELOGIC_CONSUMER_SECRET')
+        
+        base_url = os.getenv('CORELOGIC_API_URL', 'https://api-prod.corelogic.com')
+        self.BASE_URL = f"{base_url}/property/v1"
+        self.AUTH_URL = f"{base_url}/oauth/token"
+        
+        if not self.consumer_key or not self.consumer_secret:
+            raise ValueError("CoreLogic credentials not found. Set CORELOGIC_CONSUMER_KEY and CORELOGIC_CONSUMER_SECRET")
+        
+        self.access_token = None
+        self._token_expiry_mono = 0.0
+        self._credentials_key = _credentials_key(self.consumer_key, self.consumer_secret)
+        
+        # Serializes token refreshes so concurrent callers don't stampede /oauth/token
+        self._token_lock = asyncio.Lock()
+        self._client: Optional[httpx.AsyncClient] = None
+    
+    async def __aenter__(self) -> 'AsyncCoreLogicClient':
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    async def aclose(self):
+        """Close the underlying connection pool"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Lazily create the pooled HTTP client (must run inside the event loop)"""
+        if self._client is None:
+            # HTTP/2 lets bundle()'s concurrent lookups share one TLS connection.
+            # Transport retries only re-attempt failed connects (DNS/TCP/TLS), before
+            # any request is sent, so they never duplicate a request CoreLogic saw.
+            transport = httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16, keepalive_expiry=60),
+                retries=2
+            )
+            self._client = httpx.AsyncClient(
+                transport=transport,
+                headers=_DEFAULT_HEADERS,
+                timeout=30
+            )
+        return self._client
+    
+    def _token_valid(self) -> bool:
+        # Adopt a token another client already fetched with the same credentials
+        cached = CoreLogicClient._token_cache.get(self._credentials_key)
+        if cached and cached[0] != self.access_token:
+            self.access_token, self._token_expiry_mono = cached
+        
+        return bool(self.access_token) and time.monotonic() < self._token_expiry_mono
+    
+    async def _get_access_token(self) -> str:
+        """
+        Get OAuth2 access token (with caching and auto-refresh)
+        
+        Returns:
+            Valid access token
+        
+        Raises:
+            CoreLogicAuthError: If credentials are rejected (400/401/403)
+            CoreLogicRateLimited: On 429 from the token endpoint
+            CoreLogicError: On 5xx, timeouts or connection failures
+        """
+        if self._token_valid():
+            return self.access_token
+        
+        async with self._token_lock:
+            # Another coroutine may have refreshed while we waited
+            if self._token_valid():
+                return self.access_token
+            
+            try:
+                response = await self._get_client().post(
+                    self.AUTH_URL,
+                    auth=(self.consumer_key, self.consumer_secret),
+                    data={'grant_type': 'client_credentials'}
+                )
+                response.raise_for_status()
+                
+                token_data = _json(response)
+                self.access_token = token_data['access_token']
+                
+                expires_in = token_data.get('expires_in', 3600)
+                self._token_expiry_mono = _token_expiry(expires_in)
+                with CoreLogicClient._token_lock:
+                    CoreLogicClient._token_cache[self._credentials_key] = (self.access_token, self._token_expiry_mono)
+                
+                return self.access_token
+                
+            except httpx.HTTPStatusError as e:
+                if _is_outage(e.response.status_code):
+                    CoreLogicClient._record_result(False)
+                raise _token_error_for_status(e.response.status_code, e.response.text, e.response.headers.get('Retry-After'))
+            except httpx.HTTPError as e:
+                CoreLogicClient._record_result(False)
+                raise CoreLogicError(f"CoreLogic authentication request failed: {str(e)}") from e
+    
+    async def _make_request(self, endpoint: str, params: Optional[Dict] = None, method: str = 'GET') -> Dict[str, Any]:
+        """
+        Make authenticated API request to CoreLogic
+        
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+            method: HTTP method (GET, POST)
+        
+        Returns:
+            API response as dictionary
+        
+        Raises:
+            CoreLogicError: Same mapping as CoreLogicClient._make_request
+        """
+        CoreLogicClient._check_circuit()
+        token = await self._get_access_token()
+        url = f"{self.BASE_URL}/{endpoint}"
+        
+        headers = {'Authorization': f'Bearer {token}'}
+        
+        try:
+            if method == 'GET':
+                response = await self._get_client().get(url, headers=headers, params=params)
+            elif method == 'POST':
+                response = await self._get_client().post(url, headers=headers, json=params)
+            else:
+                raise ValueError(f"Unsupported HTTP method: {method}")
+            
+            response.raise_for_status()
+            CoreLogicClient._record_result(True)
+            return _json(response)
+            
+        except httpx.HTTPStatusError as e:
+            CoreLogicClient._record_result(not _is_outage(e.response.status_code))
+            if e.response.status_code == 401:
+                self.access_token = None
+                self._token_expiry_mono = 0.0
+                CoreLogicClient.invalidate_token_cache(self._credentials_key)
+            raise _error_for_status(e.response.status_code, e.response.text, e.response.headers.get('Retry-After'))
+        except httpx.TimeoutException:
+            CoreLogicClient._record_result(False)
+            raise CoreLogicError("CoreLogic API request timed out")
+        except httpx.HTTPError as e:
+            CoreLogicClient._record_result(False)
+            raise CoreLogicError(f"CoreLogic API request failed: {str(e)}")
+    
+    async def search_property(self, address: str, city: Optional[str] = None,
+                              state: Optional[str] = None, zip_code: Optional[str] = None) -> Dict[str, Any]:
+        """Search for property by address (see CoreLogicClient.search_property)"""
+        key = _search_cache_key(address, city, state, zip_code)
+        cached = CoreLogicClient._cache_get(CoreLogicClient._search_cache, key)
+        if cached is not None:
+            return cached
+        
+        params = _search_params(address, city, state, zip_code)
+        result = await self._make_request('search', params=params)
+        
+        return CoreLogicClient._cache_put(CoreLogicClient._search_cache, key, _normalize_search(result, address))
+    
+    async def get_property_details(self, clip_id: str) -> Dict[str, Any]:
+        """Get property details by CLIP ID (see CoreLogicClient.get_property_details)"""
+        cached = CoreLogicClient._cache_get(CoreLogicClient._details_cache, clip_id)
+        if cached is not None:
+            return cached
+        
+        result = await self._make_request(f'property/{clip_id}')
+        
+        return CoreLogicClient._cache_put(CoreLogicClient._details_cache, clip_id, _normalize_details(result, clip_id))
+    
+    async def get_comparables(self, clip_id: str, radius_miles: float = 0.5,
+                              max_results: int = 10) -> List[Dict[str, Any]]:
+        """Get comparable properties (see CoreLogicClient.get_comparables)"""
+        params = _comps_params(radius_miles, max_results)
+        result = await self._make_request(f'property/{clip_id}/comps', params=params)
+        
+        return _normalize_comps(result, clip_id)
+    
+    async def estimate_value(self, clip_id: str) -> Dict[str, Any]:
+        """Get AVM estimate (see CoreLogicClient.estimate_value)"""
+        cached = CoreLogicClient._cache_get(CoreLogicClient._avm_cache, clip_id)
+        if cached is not None:
+            return cached
+        
+        result = await self._make_request(f'property/{clip_id}/avm')
+        
+        return CoreLogicClient._cache_put(CoreLogicClient._avm_cache, clip_id, _normalize_avm(result))
+    
+    async def bundle(self, clip_id: str, radius_miles: float = 0.5, max_results: int = 10) -> Dict[str, Any]:
+        """
+        Fetch details, AVM, and comps for one property concurrently
+        
+        Args:
+            clip_id: Property CLIP ID
+            radius_miles: Comps search radius in miles
+            max_results: Maximum number of comps
+        
+        Returns:
+            {
+                "details": {...} or None,
+                "avm": {...} or None,
+                "comparables": [...] or None
+            }
+            A lookup that fails with CoreLogicError is returned as None so one
+            missing dataset (commonly the AVM) doesn't discard the others.
+        """
+        results = await asyncio.gather(
+            self.get_property_details(clip_id),
+            self.estimate_value(clip_id),
+            self.get_comparables(clip_id, radius_miles=radius_miles, max_results=max_results),
+            return_exceptions=True
+        )
+        
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, CoreLogicError):
+                raise result
+        
+        details, avm, comparables = (
+            None if isinstance(result, CoreLogicError) else result
+            for result in results
+        )
         
         return {
-            'estimated_value': avm_data.get('amount'),
-            'confidence_score': avm_data.get('confidenceScore'),
-            'value_range_low': avm_data.get('valueLow'),
-            'value_range_high': avm_data.get('valueHigh'),
-            'as_of_date': avm_data.get('asOfDate')
+            'details': details,
+            'avm': avm,
+            'comparables': comparables
         }
@@ -16,11 +16,15 @@ import re
 
 auth_bp = Blueprint('auth', __name__)
 
+# Validation patterns, compiled once at import
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+LETTER_PATTERN = re.compile(r'[A-Za-z]')
+DIGIT_PATTERN = re.compile(r'\d')
+
 
 def validate_email(email):
     """Validate email format"""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    return EMAIL_PATTERN.match(email) is not None
 
 
 def validate_password(password):
@@ -31,10 +35,10 @@ def validate_password(password):
     if len(password) < 8:
         return False, "Password must be at least 8 characters"
     
-    if not re.search(r'[A-Za-z]', password):
+    if not LETTER_PATTERN.search(password):
         return False, "Password must contain at least one letter"
     
-    if not re.search(r'\d', password):
+    if not DIGIT_PATTERN.search(password):
         return False, "Password must contain at least one number"
     
     return True, ""
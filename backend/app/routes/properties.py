@@ -17,6 +17,9 @@ properties_bp = Blueprint('properties', __name__)
 ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'pdf'}
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
 
+# Upper bound on rows returned by one list request; callers page with offset
+MAX_PAGE_SIZE = 100
+
 
 def allowed_file(filename):
     """Check if file extension is allowed"""
@@ -29,6 +32,30 @@ def validate_file_size(file_data):
     return len(file_data) <= MAX_FILE_SIZE
 
 
+def normalize_uuid(value):
+    """
+    Canonicalize a path parameter as a UUID before spending a database round-trip on it
+    
+    uuid.UUID also accepts braced, hyphen-less and urn:uuid: spellings that
+    Postgres rejects, so callers must query with the returned form.
+    
+    Returns:
+        Lowercase hyphenated UUID string, or None if value is not a UUID
+    """
+    try:
+        return str(uuid.UUID(value))
+    except (ValueError, TypeError):
+        return None
+
+
+def invalid_property_id_response():
+    """400 response for a malformed property ID"""
+    return jsonify({
+        'error': 'Invalid property ID',
+        'message': 'Property ID must be a valid UUID'
+    }), 400
+
+
 @properties_bp.route('/upload', methods=['POST'])
 @jwt_required()
 def upload_floor_plan_endpoint():
@@ -267,7 +294,7 @@ def list_properties():
     
     Query Parameters:
         status: Filter by status (optional)
-        limit: Number of results (default 50)
+        limit: Number of results (default 50, max 100)
         offset: Pagination offset (default 0)
     
     Returns:
@@ -288,8 +315,8 @@ def list_properties():
         
         # Get query parameters
         status = request.args.get('status')
-        limit = int(request.args.get('limit', 50))
-        offset = int(request.args.get('offset', 0))
+        limit = min(max(int(request.args.get('limit', 50)), 1), MAX_PAGE_SIZE)
+        offset = max(int(request.args.get('offset', 0)), 0)
         
         # Build query
         db = get_db()
@@ -351,6 +378,10 @@ def get_property(property_id):
             }
         }
     """
+    property_id = normalize_uuid(property_id)
+    if property_id is None:
+        return invalid_property_id_response()
+    
     try:
         user_id = get_jwt_identity()
         
@@ -405,12 +436,16 @@ def delete_property(property_id):
             "message": "Property deleted successfully"
         }
     """
+    property_id = normalize_uuid(property_id)
+    if property_id is None:
+        return invalid_property_id_response()
+    
     try:
         user_id = get_jwt_identity()
         
-        # Fetch property to get floor plan path
+        # Fetch only the storage path; extracted_data can be large and isn't needed here
         db = get_db()
-        result = db.table('properties').select('*').eq('id', property_id).eq('agent_id', user_id).execute()
+        result = db.table('properties').select('id, image_storage_path').eq('id', property_id).eq('agent_id', user_id).execute()
         
         if not result.data:
             return jsonify({
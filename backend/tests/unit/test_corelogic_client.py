@@ -3,10 +3,37 @@ Unit Tests for CoreLogic API Client
 Uses mocked responses to test without hitting real API
 """
 
+import json
+import time
+import threading
+import asyncio
+import httpx
+from http.server import BaseHTTPRequestHandler, HTTPServer
 import pytest
+import requests
 from unittest.mock import Mock, patch
-from datetime import datetime, timedelta
-from app.clients.corelogic_client import CoreLogicClient
+from app.clients.corelogic_client import (
+    AsyncCoreLogicClient,
+    CoreLogicClient,
+    CoreLogicError,
+    CoreLogicNotFound,
+    CoreLogicAuthError,
+    CoreLogicRateLimited,
+    CoreLogicUnavailable,
+    MAX_RETRY_AFTER
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_shared_caches():
+    """Isolate tests from the process-wide token and response caches"""
+    CoreLogicClient.invalidate_token_cache()
+    CoreLogicClient.clear_cache()
+    CoreLogicClient.reset_circuit()
+    yield
+    CoreLogicClient.invalidate_token_cache()
+    CoreLogicClient.clear_cache()
+    CoreLogicClient.reset_circuit()
 
 
 @pytest.fixture
@@ -22,6 +49,39 @@ def client(mock_env):
     return CoreLogicClient()
 
 
+class OutageHandler(BaseHTTPRequestHandler):
+    """Answers every request with 503 and an hours-long Retry-After"""
+    
+    def do_GET(self):
+        self.server.requests_seen += 1
+        self.send_response(503)
+        self.send_header('Retry-After', '7200')
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+    
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def outage_server():
+    """Local HTTP server simulating a CoreLogic outage"""
+    server = HTTPServer(('127.0.0.1', 0), OutageHandler)
+    server.requests_seen = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def route_to(client, server):
+    """Point a client at a local server through its real retrying adapter"""
+    client.BASE_URL = f"http://127.0.0.1:{server.server_port}/property/v1"
+    client._session.mount('http://', client._session.get_adapter('https://api-prod.corelogic.com'))
+    return client
+
+
 @pytest.fixture
 def mock_token_response():
     """Mock OAuth token response"""
@@ -83,7 +143,7 @@ class TestCoreLogicClientInit:
         assert client.consumer_key == 'test_key'
         assert client.consumer_secret == 'test_secret'
         assert client.access_token is None
-        assert client.token_expires_at is None
+        assert client._token_expiry_mono == 0.0
     
     def test_init_with_explicit_credentials(self):
         """Test initialization with explicit credentials"""
@@ -98,22 +158,31 @@ class TestCoreLogicClientInit:
         
         with pytest.raises(ValueError, match="CoreLogic credentials not found"):
             CoreLogicClient()
+    
+    def test_connection_pool_shared_across_instances(self, mock_env):
+        """Test per-task clients reuse one pooled adapter instead of building their own"""
+        first = CoreLogicClient()
+        second = CoreLogicClient()
+        
+        assert first._session is not second._session
+        assert first._session.get_adapter('https://api-prod.corelogic.com') is \
+            second._session.get_adapter('https://api-prod.corelogic.com')
 
 
 class TestOAuth2TokenManagement:
     """Test OAuth2 token retrieval and caching"""
     
-    @patch('app.clients.corelogic_client.requests.post')
+    @patch('app.clients.corelogic_client.requests.Session.post')
     def test_get_access_token_success(self, mock_post, client, mock_token_response):
         """Test successful token retrieval"""
-        mock_post.return_value.json.return_value = mock_token_response
+        mock_post.return_value.content = json.dumps(mock_token_response).encode()
         mock_post.return_value.raise_for_status = Mock()
         
         token = client._get_access_token()
         
         assert token == 'mock_access_token_12345'
         assert client.access_token == 'mock_access_token_12345'
-        assert client.token_expires_at is not None
+        assert client._token_expiry_mono > time.monotonic()
         
         # Verify correct auth request
         mock_post.assert_called_once()
@@ -121,10 +190,10 @@ class TestOAuth2TokenManagement:
         assert call_kwargs['auth'] == ('test_key', 'test_secret')
         assert call_kwargs['data'] == {'grant_type': 'client_credentials'}
     
-    @patch('app.clients.corelogic_client.requests.post')
+    @patch('app.clients.corelogic_client.requests.Session.post')
     def test_token_caching(self, mock_post, client, mock_token_response):
         """Test token is cached and not re-requested"""
-        mock_post.return_value.json.return_value = mock_token_response
+        mock_post.return_value.content = json.dumps(mock_token_response).encode()
         mock_post.return_value.raise_for_status = Mock()
         
         # First call - should request token
@@ -136,21 +205,121 @@ class TestOAuth2TokenManagement:
         assert mock_post.call_count == 1  # No additional call
         assert token1 == token2
     
-    @patch('app.clients.corelogic_client.requests.post')
+    @patch('app.clients.corelogic_client.requests.Session.post')
     def test_token_refresh_when_expired(self, mock_post, client, mock_token_response):
         """Test token is refreshed when expired"""
-        mock_post.return_value.json.return_value = mock_token_response
+        mock_post.return_value.content = json.dumps(mock_token_response).encode()
         mock_post.return_value.raise_for_status = Mock()
         
         # First call
         token1 = client._get_access_token()
         
-        # Manually expire token
-        client.token_expires_at = datetime.now() - timedelta(minutes=10)
+        # Manually expire token (instance and shared cache)
+        client._token_expiry_mono = time.monotonic() - 600
+        CoreLogicClient.invalidate_token_cache()
         
         # Second call - should request new token
         token2 = client._get_access_token()
         assert mock_post.call_count == 2
+    
+    @patch('app.clients.corelogic_client.requests.Session.post')
+    def test_token_sets_session_headers(self, mock_post, client, mock_token_response):
+        """Test new token is applied to the pooled session's default headers"""
+        mock_post.return_value.content = json.dumps(mock_token_response).encode()
+        mock_post.return_value.raise_for_status = Mock()
+        
+        client._get_access_token()
+        
+        assert client._session.headers['Authorization'] == 'Bearer mock_access_token_12345'
+        assert client._session.headers['Accept'] == 'application/json'
+    
+    @patch('app.clients.corelogic_client.requests.Session.head')
+    @patch('app.clients.corelogic_client.requests.Session.post')
+    def test_warm_up_fetches_token_and_connection(self, mock_post, mock_head, mock_env, mock_token_response, monkeypatch):
+        """Test CORELOGIC_WARMUP=1 primes the token and connection pool"""
+        monkeypatch.setenv('CORELOGIC_WARMUP', '1')
+        monkeypatch.setattr(CoreLogicClient, '_warmed_up', False)
+        mock_post.return_value.content = json.dumps(mock_token_response).encode()
+        mock_post.return_value.raise_for_status = Mock()
+        
+        with patch('app.clients.corelogic_client.threading.Thread') as mock_thread:
+            client = CoreLogicClient()
+        mock_thread.assert_called_once_with(target=client._warm_up, daemon=True)
+        
+        client._warm_up()
+        
+        assert client.access_token == 'mock_access_token_12345'
+        mock_head.assert_called_once_with(client.BASE_URL, timeout=5)
+    
+    def test_warm_up_runs_once_per_process(self, mock_env, monkeypatch):
+        """Test per-task clients don't each start a warm-up thread"""
+        monkeypatch.setenv('CORELOGIC_WARMUP', '1')
+        monkeypatch.setattr(CoreLogicClient, '_warmed_up', False)
+        
+        with patch('app.clients.corelogic_client.threading.Thread') as mock_thread:
+            CoreLogicClient()
+            CoreLogicClient()
+        
+        mock_thread.assert_called_once()
+    
+    @patch('app.clients.corelogic_client.requests.Session.post')
+    def test_warm_up_swallows_errors(self, mock_post, client):
+        """Test a failed warm-up never raises"""
+        mock_post.side_effect = requests.ConnectionError("Network error")
+        
+        client._warm_up()
+        
+        assert client.access_token is None
+    
+    @patch('app.clients.corelogic_client.requests.Session.post')
+    def test_slow_refresh_does_not_block_other_credentials(self, mock_post, mock_env, mock_token_response):
+        """Test the token POST holds a per-credentials lock, not a process-wide one"""
+        release = threading.Event()
+        
+        def token_response(url, auth, **kwargs):
+            if auth[0] == 'slow_key':
+                release.wait(5)
+            response = Mock()
+            response.content = json.dumps(mock_token_response).encode()
+            return response
+        
+        mock_post.side_effect = token_response
+        slow = CoreLogicClient('slow_key', 'slow_secret')
+        thread = threading.Thread(target=slow._get_access_token)
+        thread.start()
+        
+        try:
+            # Returns while the other refresh is still in flight
+            assert CoreLogicClient()._get_access_token() == 'mock_access_token_12345'
+            assert thread.is_alive()
+        finally:
+            release.set()
+            thread.join()
+    
+    @patch('app.clients.corelogic_client.requests.Session.post')
+    def test_token_shared_across_instances(self, mock_post, mock_env, mock_token_response):
+        """Test a second client with the same credentials reuses the cached token"""
+        mock_post.return_value.content = json.dumps(mock_token_response).encode()
+        mock_post.return_value.raise_for_status = Mock()
+        
+        CoreLogicClient()._get_access_token()
+        second = CoreLogicClient()
+        token = second._get_access_token()
+        
+        assert mock_post.call_count == 1
+        assert token == 'mock_access_token_12345'
+        assert second._session.headers['Authorization'] == 'Bearer mock_access_token_12345'
+    
+    @patch('app.clients.corelogic_client.requests.Session.post')
+    def test_token_not_shared_across_credentials(self, mock_post, mock_env, mock_token_response):
+        """Test different credentials get their own token"""
+        mock_post.return_value.content = json.dumps(mock_token_response).encode()
+        mock_post.return_value.raise_for_status = Mock()
+        
+        CoreLogicClient()._get_access_token()
+        CoreLogicClient(consumer_key='other_key', consumer_secret='other_secret')._get_access_token()
+        
+        assert mock_post.call_count == 2
 
 
 class TestPropertySearch:
@@ -201,6 +370,27 @@ class TestPropertySearch:
         assert call_args[1]['params']['state'] == "FL"
         assert call_args[1]['params']['zip'] == "33101"
 
+    
+    @patch.object(CoreLogicClient, '_make_request')
+    def test_search_cached_across_address_variants(self, mock_request, client, mock_property_search_response):
+        """Test repeat searches for the same normalized address hit the cache"""
+        mock_request.return_value = mock_property_search_response
+        
+        first = client.search_property("123 Main St", city="Miami")
+        second = CoreLogicClient().search_property("  123  main st ", city="miami")
+        
+        assert mock_request.call_count == 1
+        assert first == second
+    
+    @patch.object(CoreLogicClient, '_make_request')
+    def test_cached_result_is_not_shared_by_reference(self, mock_request, client, mock_property_search_response):
+        """Test mutating a returned result doesn't corrupt the cache"""
+        mock_request.return_value = mock_property_search_response
+        
+        client.search_property("123 Main St")['clip_id'] = 'MUTATED'
+        
+        assert client.search_property("123 Main St")['clip_id'] == 'CLIP-12345'
+
 
 class TestPropertyDetails:
     """Test property details retrieval"""
@@ -294,6 +484,57 @@ class TestComparables:
         
         with pytest.raises(Exception, match="No comparable properties found"):
             client.get_comparables('CLIP-12345')
+    
+    @patch.object(CoreLogicClient, '_make_request')
+    def test_get_comparables_sparse_record(self, mock_request, client):
+        """Test missing or null nested sections normalize to None"""
+        mock_request.return_value = {
+            'comparables': [{'clipId': 'CLIP-COMP1', 'building': None, 'sale': {}}]
+        }
+        
+        comp = client.get_comparables('CLIP-12345')[0]
+        
+        assert comp['clip_id'] == 'CLIP-COMP1'
+        assert comp['bedrooms'] is None
+        assert comp['last_sale_price'] is None
+        assert comp['similarity_score'] == 0
+    
+    @patch.object(CoreLogicClient, '_make_request')
+    def test_get_comparables_enrich(self, mock_request, client):
+        """Test enrich=True attaches details per comp and tolerates failures"""
+        def respond(endpoint, params=None):
+            if endpoint.endswith('/comps'):
+                return {'comparables': [{'clipId': 'CLIP-COMP1'}, {'clipId': 'CLIP-COMP2'}]}
+            if endpoint == 'property/CLIP-COMP2':
+                raise CoreLogicNotFound("Property not found in CoreLogic database", status_code=404)
+            return {'building': {'yearBuilt': 2010}}
+        mock_request.side_effect = respond
+        
+        comps = client.get_comparables('CLIP-12345', enrich=True)
+        
+        assert comps[0]['details']['building'] == {'yearBuilt': 2010}
+        assert comps[1]['details'] is None
+        assert mock_request.call_count == 3
+    
+    @patch.object(CoreLogicClient, '_make_request')
+    def test_get_comparables_enrich_timeout(self, mock_request, client):
+        """Test a detail lookup that outlives ENRICH_TIMEOUT yields details=None"""
+        release = threading.Event()
+        
+        def respond(endpoint, params=None):
+            if endpoint.endswith('/comps'):
+                return {'comparables': [{'clipId': 'CLIP-SLOW'}]}
+            release.wait(5)
+            return {'building': {'yearBuilt': 2010}}
+        mock_request.side_effect = respond
+        client.ENRICH_TIMEOUT = 0.05
+        
+        try:
+            comps = client.get_comparables('CLIP-12345', enrich=True)
+        finally:
+            release.set()
+        
+        assert comps[0]['details'] is None
 
 
 class TestAVM:
@@ -323,20 +564,57 @@ class TestAVM:
         
         # Verify correct endpoint
         mock_request.assert_called_once_with('property/CLIP-12345/avm')
+    
+    @patch.object(CoreLogicClient, '_make_request')
+    def test_estimate_value_cached(self, mock_request, client):
+        """Test AVM lookups for the same CLIP ID are served from cache"""
+        mock_request.return_value = {'avm': {'amount': 425000}}
+        
+        client.estimate_value('CLIP-12345')
+        estimate = client.estimate_value('CLIP-12345')
+        
+        assert estimate['estimated_value'] == 425000
+        assert mock_request.call_count == 1
 
 
 class TestErrorHandling:
     """Test error handling and edge cases"""
     
-    @patch('app.clients.corelogic_client.requests.post')
+    @patch('app.clients.corelogic_client.requests.Session.post')
     def test_auth_failure(self, mock_post, client):
         """Test handling of authentication failure"""
-        mock_post.side_effect = Exception("Network error")
+        mock_post.side_effect = requests.ConnectionError("Network error")
+        
+        with pytest.raises(CoreLogicError, match="CoreLogic authentication request failed") as exc_info:
+            client._get_access_token()
+        assert not isinstance(exc_info.value, CoreLogicAuthError)
+    
+    @patch('app.clients.corelogic_client.requests.Session.post')
+    def test_auth_rejected_credentials(self, mock_post, client):
+        """Test 401 from the token endpoint is a terminal auth error"""
+        mock_post.return_value.status_code = 401
+        mock_post.return_value.headers = {}
+        mock_post.return_value.text = 'invalid_client'
+        mock_post.return_value.raise_for_status.side_effect = requests.HTTPError(response=mock_post.return_value)
+        
+        with pytest.raises(CoreLogicAuthError) as exc_info:
+            client._get_access_token()
+        assert exc_info.value.status_code == 401
+    
+    @patch('app.clients.corelogic_client.requests.Session.post')
+    def test_auth_server_error_is_retriable(self, mock_post, client):
+        """Test 5xx from the token endpoint is not reported as rejected credentials"""
+        mock_post.return_value.status_code = 503
+        mock_post.return_value.headers = {}
+        mock_post.return_value.text = 'unavailable'
+        mock_post.return_value.raise_for_status.side_effect = requests.HTTPError(response=mock_post.return_value)
         
-        with pytest.raises(Exception, match="CoreLogic authentication failed"):
+        with pytest.raises(CoreLogicError) as exc_info:
             client._get_access_token()
+        assert not isinstance(exc_info.value, CoreLogicAuthError)
+        assert exc_info.value.status_code == 503
     
-    @patch('app.clients.corelogic_client.requests.get')
+    @patch('app.clients.corelogic_client.requests.Session.get')
     @patch.object(CoreLogicClient, '_get_access_token')
     def test_404_not_found(self, mock_token, mock_get, client):
         """Test handling of 404 property not found"""
@@ -347,7 +625,7 @@ class TestErrorHandling:
         with pytest.raises(Exception, match="Property not found in CoreLogic database"):
             client._make_request('property/INVALID')
     
-    @patch('app.clients.corelogic_client.requests.get')
+    @patch('app.clients.corelogic_client.requests.Session.get')
     @patch.object(CoreLogicClient, '_get_access_token')
     def test_rate_limit(self, mock_token, mock_get, client):
         """Test handling of rate limit (429)"""
@@ -358,12 +636,365 @@ class TestErrorHandling:
         with pytest.raises(Exception, match="rate limit exceeded"):
             client._make_request('search')
     
-    @patch('app.clients.corelogic_client.requests.get')
+    @patch('app.clients.corelogic_client.time.sleep')
+    @patch('app.clients.corelogic_client.requests.Session.get')
     @patch.object(CoreLogicClient, '_get_access_token')
-    def test_timeout(self, mock_token, mock_get, client):
+    def test_timeout(self, mock_token, mock_get, mock_sleep, client):
         """Test handling of request timeout"""
         mock_token.return_value = 'test_token'
         mock_get.side_effect = requests.Timeout()
         
         with pytest.raises(Exception, match="timed out"):
             client._make_request('search')
+        assert mock_get.call_count == CoreLogicClient.MAX_ATTEMPTS
+
+
+class TestRetries:
+    """Test retry behavior around _make_request"""
+    
+    def test_session_retries_rate_limits_and_server_errors(self, client):
+        """Test the pooled adapter retries 429/5xx and honors Retry-After"""
+        retry = client._session.get_adapter('https://api-prod.corelogic.com').max_retries
+        assert set(retry.status_forcelist) == {429, 500, 502, 503, 504}
+        assert retry.respect_retry_after_header
+        assert not retry.raise_on_status
+    
+    @patch('app.clients.corelogic_client.time.sleep')
+    @patch('app.clients.corelogic_client.requests.Session.get')
+    @patch.object(CoreLogicClient, '_get_access_token')
+    def test_connection_error_then_success(self, mock_token, mock_get, mock_sleep, client):
+        """Test a transient connection error is retried after a jittered sleep"""
+        mock_token.return_value = 'test_token'
+        ok = Mock()
+        ok.content = b'{"avm": {"amount": 1}}'
+        mock_get.side_effect = [requests.ConnectionError("reset"), ok]
+        
+        assert client._make_request('property/CLIP-12345/avm') == {'avm': {'amount': 1}}
+        assert mock_get.call_count == 2
+        assert 2 <= mock_sleep.call_args[0][0] <= 4
+    
+    @patch('app.clients.corelogic_client.time.sleep')
+    @patch.object(CoreLogicClient, '_get_access_token', return_value='test_token')
+    def test_retry_sleep_budget_is_per_request(self, mock_token, mock_sleep, client, outage_server):
+        """Test a huge Retry-After spends the whole budget once instead of on every retry"""
+        route_to(client, outage_server)
+        
+        with pytest.raises(CoreLogicError) as exc_info:
+            client._make_request('property/CLIP-12345/avm')
+        
+        assert exc_info.value.status_code == 503
+        assert outage_server.requests_seen == 2
+        assert sum(call.args[0] for call in mock_sleep.call_args_list) == MAX_RETRY_AFTER
+    
+    @patch('app.clients.corelogic_client.time.sleep')
+    def test_retry_backoff_shares_budget(self, mock_sleep, client, monkeypatch):
+        """Test exponential backoff stops retrying once the budget is spent"""
+        # Keep the circuit breaker from ending the retries first
+        monkeypatch.setattr(CoreLogicClient, 'CIRCUIT_THRESHOLD', 100)
+        retry = client._session.get_adapter('https://api-prod.corelogic.com').max_retries
+        response = Mock(status=503, headers={})
+        response.get_redirect_location.return_value = False
+        
+        while retry.is_retry('GET', 503):
+            retry = retry.increment('GET', '/avm', response=response)
+            retry.sleep(response)
+        
+        assert sum(call.args[0] for call in mock_sleep.call_args_list) <= MAX_RETRY_AFTER
+        assert retry.sleep_budget == 0
+    
+    @patch('app.clients.corelogic_client.time.sleep')
+    @patch('app.clients.corelogic_client.requests.Session.get')
+    @patch('app.clients.corelogic_client.requests.Session.post')
+    def test_token_refresh_timeout_is_retried(self, mock_post, mock_get, mock_sleep, client, mock_token_response):
+        """Test a timed-out token refresh goes through the same retry loop"""
+        token_ok = Mock()
+        token_ok.content = json.dumps(mock_token_response).encode()
+        mock_post.side_effect = [requests.Timeout("token timeout"), token_ok]
+        mock_get.return_value.content = b'{"avm": {"amount": 1}}'
+        
+        assert client._make_request('property/CLIP-12345/avm') == {'avm': {'amount': 1}}
+        assert mock_post.call_count == 2
+        assert mock_sleep.call_count == 1
+    
+    @patch('app.clients.corelogic_client.requests.Session.get')
+    @patch.object(CoreLogicClient, '_get_access_token')
+    def test_401_retries_once_with_fresh_token(self, mock_token, mock_get, client):
+        """Test a 401 evicts the token and the request is retried once"""
+        mock_token.return_value = 'test_token'
+        unauthorized = Mock(status_code=401, headers={}, text='')
+        unauthorized.raise_for_status.side_effect = requests.HTTPError(response=unauthorized)
+        ok = Mock()
+        ok.content = b'{"properties": []}'
+        mock_get.side_effect = [unauthorized, ok]
+        
+        assert client._make_request('search') == {'properties': []}
+        assert mock_token.call_count == 2
+
+
+class TestStructuredErrors:
+    """Test HTTP failures map onto the CoreLogicError hierarchy"""
+    
+    def _http_error(self, mock_get, status_code, headers=None):
+        mock_get.return_value.status_code = status_code
+        mock_get.return_value.headers = headers or {}
+        mock_get.return_value.text = 'error body'
+        mock_get.return_value.raise_for_status.side_effect = requests.HTTPError(response=mock_get.return_value)
+    
+    @patch('app.clients.corelogic_client.requests.Session.get')
+    @patch.object(CoreLogicClient, '_get_access_token')
+    def test_404_raises_not_found(self, mock_token, mock_get, client):
+        """Test 404 maps to CoreLogicNotFound"""
+        mock_token.return_value = 'test_token'
+        self._http_error(mock_get, 404)
+        
+        with pytest.raises(CoreLogicNotFound) as exc_info:
+            client._make_request('property/INVALID')
+        assert exc_info.value.status_code == 404
+    
+    @patch('app.clients.corelogic_client.requests.Session.get')
+    @patch.object(CoreLogicClient, '_get_access_token')
+    def test_401_raises_auth_error_and_clears_token(self, mock_token, mock_get, client):
+        """Test 401 maps to CoreLogicAuthError and drops the cached token"""
+        mock_token.return_value = 'test_token'
+        client.access_token = 'stale_token'
+        self._http_error(mock_get, 401)
+        
+        CoreLogicClient._token_cache[client._credentials_key] = ('stale_token', time.monotonic() + 3600)
+        
+        with pytest.raises(CoreLogicAuthError):
+            client._make_request('search')
+        assert client.access_token is None
+        assert client._credentials_key not in CoreLogicClient._token_cache
+    
+    @patch('app.clients.corelogic_client.requests.Session.get')
+    @patch.object(CoreLogicClient, '_get_access_token')
+    def test_429_carries_retry_after(self, mock_token, mock_get, client):
+        """Test 429 maps to CoreLogicRateLimited with Retry-After seconds"""
+        mock_token.return_value = 'test_token'
+        self._http_error(mock_get, 429, headers={'Retry-After': '7'})
+        
+        with pytest.raises(CoreLogicRateLimited) as exc_info:
+            client._make_request('search')
+        assert exc_info.value.retry_after == 7
+    
+    @patch('app.clients.corelogic_client.requests.Session.get')
+    @patch.object(CoreLogicClient, '_get_access_token')
+    def test_other_status_raises_base_error(self, mock_token, mock_get, client):
+        """Test unmapped statuses raise the base CoreLogicError"""
+        mock_token.return_value = 'test_token'
+        self._http_error(mock_get, 500)
+        
+        with pytest.raises(CoreLogicError) as exc_info:
+            client._make_request('search')
+        assert not isinstance(exc_info.value, CoreLogicRateLimited)
+        assert exc_info.value.status_code == 500
+    
+    @patch('app.clients.corelogic_client.requests.Session.get')
+    @patch.object(CoreLogicClient, '_get_access_token')
+    def test_invalid_json_raises_base_error(self, mock_token, mock_get, client):
+        """Test an undecodable body surfaces as CoreLogicError"""
+        mock_token.return_value = 'test_token'
+        mock_get.return_value.content = b'<html>gateway error</html>'
+        
+        with pytest.raises(CoreLogicError, match='invalid JSON'):
+            client._make_request('search')
+
+
+
+class TestCircuitBreaker:
+    """Test the process-wide circuit breaker around CoreLogic requests"""
+    
+    def _server_error(self, mock_get):
+        mock_get.return_value.status_code = 503
+        mock_get.return_value.headers = {}
+        mock_get.return_value.text = 'unavailable'
+        mock_get.return_value.raise_for_status.side_effect = requests.HTTPError(response=mock_get.return_value)
+    
+    @patch('app.clients.corelogic_client.requests.Session.get')
+    @patch.object(CoreLogicClient, '_get_access_token')
+    def test_opens_after_threshold_and_fails_fast(self, mock_token, mock_get, client):
+        """Test repeated 5xx opens the circuit so later calls skip the network"""
+        mock_token.return_value = 'test_token'
+        self._server_error(mock_get)
+        
+        for _ in range(CoreLogicClient.CIRCUIT_THRESHOLD):
+            with pytest.raises(CoreLogicError):
+                client._make_request('search')
+        
+        with pytest.raises(CoreLogicUnavailable) as exc_info:
+            CoreLogicClient()._make_request('search')
+        assert mock_get.call_count == CoreLogicClient.CIRCUIT_THRESHOLD
+        assert exc_info.value.retry_after > 0
+    
+    @patch('app.clients.corelogic_client.time.sleep')
+    @patch.object(CoreLogicClient, '_get_access_token', return_value='test_token')
+    def test_retried_outage_responses_count_toward_circuit(self, mock_token, mock_sleep, client, outage_server):
+        """Test every 503 seen by urllib3, not just each exhausted call, counts as a failure"""
+        route_to(client, outage_server)
+        
+        for _ in range(3):
+            with pytest.raises(CoreLogicError) as exc_info:
+                client._make_request('search')
+            assert exc_info.value.status_code == 503
+        
+        # 2 + 2 + 1 responses: the one that opens the circuit isn't retried
+        assert outage_server.requests_seen == CoreLogicClient.CIRCUIT_THRESHOLD
+        with pytest.raises(CoreLogicUnavailable):
+            client._make_request('search')
+        assert outage_server.requests_seen == CoreLogicClient.CIRCUIT_THRESHOLD
+    
+    @patch('app.clients.corelogic_client.requests.Session.get')
+    @patch.object(CoreLogicClient, '_get_access_token')
+    def test_client_errors_do_not_trip_circuit(self, mock_token, mock_get, client):
+        """Test 404s mean the API is up and don't count as failures"""
+        mock_token.return_value = 'test_token'
+        mock_get.return_value.status_code = 404
+        mock_get.return_value.headers = {}
+        mock_get.return_value.raise_for_status.side_effect = requests.HTTPError(response=mock_get.return_value)
+        
+        for _ in range(CoreLogicClient.CIRCUIT_THRESHOLD + 1):
+            with pytest.raises(CoreLogicNotFound):
+                client._make_request('property/INVALID')
+    
+    @patch('app.clients.corelogic_client.requests.Session.get')
+    @patch.object(CoreLogicClient, '_get_access_token')
+    def test_half_open_probe_closes_circuit(self, mock_token, mock_get, client):
+        """Test a successful probe after the cooldown closes the circuit"""
+        mock_token.return_value = 'test_token'
+        self._server_error(mock_get)
+        for _ in range(CoreLogicClient.CIRCUIT_THRESHOLD):
+            with pytest.raises(CoreLogicError):
+                client._make_request('search')
+        
+        # Cooldown elapsed; API has recovered
+        CoreLogicClient._circuit_open_until = time.monotonic() - 1
+        mock_get.return_value.raise_for_status.side_effect = None
+        mock_get.return_value.content = b'{"properties": []}'
+        
+        assert client._make_request('search') == {'properties': []}
+        assert client._make_request('search') == {'properties': []}
+
+    
+    @patch('app.clients.corelogic_client.requests.Session.post')
+    def test_token_outage_opens_circuit(self, mock_post, client):
+        """Test repeated 5xx from the token endpoint trips the breaker"""
+        mock_post.return_value.status_code = 503
+        mock_post.return_value.headers = {}
+        mock_post.return_value.text = 'unavailable'
+        mock_post.return_value.raise_for_status.side_effect = requests.HTTPError(response=mock_post.return_value)
+        
+        for _ in range(CoreLogicClient.CIRCUIT_THRESHOLD):
+            with pytest.raises(CoreLogicError):
+                client._make_request('search')
+        
+        with pytest.raises(CoreLogicUnavailable):
+            client._make_request('search')
+        assert mock_post.call_count == CoreLogicClient.CIRCUIT_THRESHOLD
+    
+    @patch('app.clients.corelogic_client.time.sleep')
+    @patch('app.clients.corelogic_client.requests.Session.post')
+    def test_token_timeouts_count_once_per_request(self, mock_post, mock_sleep, client):
+        """Test a request whose token refresh keeps timing out records one failure"""
+        mock_post.side_effect = requests.Timeout("token timeout")
+        
+        with pytest.raises(CoreLogicError, match="timed out"):
+            client._make_request('search')
+        
+        assert CoreLogicClient._consecutive_failures == 1
+
+
+class TestAsyncClient:
+    """Test AsyncCoreLogicClient against a mocked transport"""
+    
+    def _client(self, mock_env, handler):
+        client = AsyncCoreLogicClient()
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return client
+    
+    def test_bundle_fetches_concurrently_with_one_token(self, mock_env, mock_token_response):
+        """Test bundle() runs all lookups and authenticates only once"""
+        calls = []
+        
+        def handler(request):
+            calls.append(request.url.path)
+            if request.url.path.endswith('/oauth/token'):
+                return httpx.Response(200, json=mock_token_response)
+            assert request.headers['Authorization'] == 'Bearer mock_access_token_12345'
+            if request.url.path.endswith('/avm'):
+                return httpx.Response(200, json={'avm': {'amount': 425000}})
+            if request.url.path.endswith('/comps'):
+                return httpx.Response(200, json={'comparables': [{'clipId': 'CLIP-COMP1'}]})
+            return httpx.Response(200, json={'building': {'yearBuilt': 2010}})
+        
+        async def run():
+            async with self._client(mock_env, handler) as client:
+                return await client.bundle('CLIP-12345')
+        
+        bundle = asyncio.run(run())
+        
+        assert bundle['details']['building'] == {'yearBuilt': 2010}
+        assert bundle['avm']['estimated_value'] == 425000
+        assert bundle['comparables'][0]['clip_id'] == 'CLIP-COMP1'
+        assert sum(path.endswith('/oauth/token') for path in calls) == 1
+    
+    def test_bundle_tolerates_missing_avm(self, mock_env, mock_token_response):
+        """Test a failed lookup comes back as None instead of failing the bundle"""
+        def handler(request):
+            if request.url.path.endswith('/oauth/token'):
+                return httpx.Response(200, json=mock_token_response)
+            if request.url.path.endswith('/avm'):
+                return httpx.Response(404)
+            if request.url.path.endswith('/comps'):
+                return httpx.Response(200, json={'comparables': [{'clipId': 'CLIP-COMP1'}]})
+            return httpx.Response(200, json={})
+        
+        async def run():
+            async with self._client(mock_env, handler) as client:
+                return await client.bundle('CLIP-12345')
+        
+        bundle = asyncio.run(run())
+        
+        assert bundle['avm'] is None
+        assert bundle['details']['clip_id'] == 'CLIP-12345'
+    
+    def test_rate_limit_maps_to_structured_error(self, mock_env, mock_token_response):
+        """Test async errors use the same CoreLogicError hierarchy"""
+        def handler(request):
+            if request.url.path.endswith('/oauth/token'):
+                return httpx.Response(200, json=mock_token_response)
+            return httpx.Response(429, headers={'Retry-After': '3'})
+        
+        async def run():
+            async with self._client(mock_env, handler) as client:
+                return await client.estimate_value('CLIP-12345')
+        
+        with pytest.raises(CoreLogicRateLimited) as exc_info:
+            asyncio.run(run())
+        assert exc_info.value.retry_after == 3
+    
+    def test_token_server_error_is_not_auth_error(self, mock_env):
+        """Test a 5xx from the token endpoint isn't reported as rejected credentials"""
+        def handler(request):
+            return httpx.Response(503, text='unavailable')
+        
+        async def run():
+            async with self._client(mock_env, handler) as client:
+                return await client.estimate_value('CLIP-12345')
+        
+        with pytest.raises(CoreLogicError) as exc_info:
+            asyncio.run(run())
+        assert not isinstance(exc_info.value, CoreLogicAuthError)
+        assert exc_info.value.status_code == 503
+    
+    def test_token_network_error_counts_toward_circuit(self, mock_env):
+        """Test async token fetch failures are recorded by the breaker"""
+        def handler(request):
+            raise httpx.ConnectError("connection refused")
+        
+        async def run():
+            async with self._client(mock_env, handler) as client:
+                return await client.estimate_value('CLIP-12345')
+        
+        with pytest.raises(CoreLogicError):
+            asyncio.run(run())
+        assert CoreLogicClient._consecutive_failures == 1
@@ -0,0 +1,161 @@
+"""
+Unit tests for floor plan image preprocessing
+"""
+
+import io
+import json
+import pytest
+import requests
+from unittest.mock import Mock, patch
+from PIL import Image, ImageDraw
+from app.agents.floor_plan_analyst import (
+    FloorPlanAnalyst,
+    prepare_image,
+    IMAGE_DOWNLOAD_TIMEOUT,
+    MAX_IMAGE_DIMENSION,
+)
+
+FLOOR_PLAN_URL = 'https://storage.example.com/floor-plan.png'
+
+
+def make_image(size, format='PNG', exif=None):
+    """Encode a blank image of the given size"""
+    output = io.BytesIO()
+    image = Image.new('RGB', size, 'white')
+    if exif is not None:
+        image.save(output, format=format, exif=exif)
+    else:
+        image.save(output, format=format)
+    return output.getvalue()
+
+
+class TestMimeTypeDetection:
+    """Test MIME type detection in prepare_image"""
+
+    @pytest.mark.parametrize('format, expected', [
+        ('PNG', 'image/png'),
+        ('JPEG', 'image/jpeg'),
+        ('GIF', 'image/gif'),
+        ('WEBP', 'image/webp'),
+    ])
+    def test_image_formats(self, format, expected):
+        """Test raster formats are labelled from PIL's detected format"""
+        data = make_image((10, 10), format=format)
+        assert prepare_image(data) == (data, expected)
+
+    def test_pdf(self):
+        """Test PDFs are recognized from their header without decoding"""
+        data = b'%PDF-1.7\n...'
+        assert prepare_image(data) == (data, 'application/pdf')
+
+    def test_undecodable_defaults_to_png(self):
+        """Test unrecognized data is passed through labelled image/png"""
+        assert prepare_image(b'not an image') == (b'not an image', 'image/png')
+        assert prepare_image(b'') == (b'', 'image/png')
+
+
+class TestDownscaling:
+    """Test oversized floor plan downscaling in prepare_image"""
+
+    def test_small_image_passes_through(self):
+        """Test images within the limit are returned byte-for-byte"""
+        data = make_image((100, 50))
+        assert prepare_image(data) == (data, 'image/png')
+
+    def test_truncated_image_passes_through(self):
+        """Test a corrupt image is returned unchanged with its detected type"""
+        data = make_image((MAX_IMAGE_DIMENSION * 2, 100))[:200]
+        assert prepare_image(data) == (data, 'image/png')
+
+    @pytest.mark.parametrize('format, mime_type', [
+        ('PNG', 'image/png'),
+        ('JPEG', 'image/jpeg'),
+    ])
+    def test_large_image_is_downscaled(self, format, mime_type):
+        """Test the long side is capped at MAX_IMAGE_DIMENSION"""
+        data = make_image((MAX_IMAGE_DIMENSION * 2, 100), format=format)
+        
+        result, result_mime = prepare_image(data)
+        
+        assert result_mime == mime_type
+        with Image.open(io.BytesIO(result)) as image:
+            assert image.format == format
+            assert image.size == (MAX_IMAGE_DIMENSION, 50)
+
+    def test_exif_orientation_is_applied(self):
+        """Test rotated camera photos keep their orientation after re-encoding"""
+        exif = Image.Exif()
+        exif[0x0112] = 6  # Orientation: rotate 90 CW
+        data = make_image((MAX_IMAGE_DIMENSION * 2, 100), format='JPEG', exif=exif)
+        
+        result, _ = prepare_image(data)
+        
+        with Image.open(io.BytesIO(result)) as image:
+            assert image.size == (50, MAX_IMAGE_DIMENSION)
+    
+    @pytest.mark.parametrize('mode, background, ink', [
+        ('1', 1, 0),
+        ('P', 0, 1),
+    ])
+    def test_thin_lines_survive_bilevel_and_palette_scans(self, mode, background, ink):
+        """Test a 1px wall isn't dropped by a NEAREST fallback when halving the size"""
+        scan = Image.new(mode, (MAX_IMAGE_DIMENSION * 2, 64), background)
+        if mode == 'P':
+            scan.putpalette([255, 255, 255, 0, 0, 0])
+        ImageDraw.Draw(scan).line([(1000, 0), (1000, 63)], fill=ink)
+        output = io.BytesIO()
+        scan.save(output, format='PNG')
+        
+        result, _ = prepare_image(output.getvalue())
+        
+        with Image.open(io.BytesIO(result)) as image:
+            assert image.size == (MAX_IMAGE_DIMENSION, 32)
+            assert min(image.convert('L').getdata()) < 200
+
+
+class TestAnalyzeFloorPlan:
+    """Test image download and the Gemini request in analyze_floor_plan"""
+    
+    @pytest.fixture
+    def analyst(self):
+        """Analyst with Gemini stubbed to return a fixed analysis"""
+        analyst = FloorPlanAnalyst()
+        with patch.object(analyst.model, 'generate_content') as mock_generate:
+            mock_generate.return_value.text = json.dumps({'bedrooms': 3, 'bathrooms': 2.5})
+            yield analyst
+    
+    @patch('requests.get')
+    def test_url_download_uses_timeout(self, mock_get, analyst):
+        """Test the image download can't hang the worker"""
+        mock_get.return_value.content = make_image((10, 10))
+        
+        result = analyst.analyze_floor_plan(image_url=FLOOR_PLAN_URL)
+        
+        mock_get.assert_called_once_with(FLOOR_PLAN_URL, timeout=IMAGE_DOWNLOAD_TIMEOUT)
+        assert result['bedrooms'] == 3
+        assert result['bathrooms'] == 2.5
+    
+    @patch('requests.get')
+    def test_url_download_http_error_returns_fallback(self, mock_get, analyst):
+        """Test a failed download returns the empty fallback without calling Gemini"""
+        mock_get.return_value.raise_for_status.side_effect = requests.HTTPError('404 Not Found')
+        
+        result = analyst.analyze_floor_plan(image_url=FLOOR_PLAN_URL)
+        
+        assert result['bedrooms'] == 0
+        assert result['rooms'] == []
+        assert '404 Not Found' in result['notes']
+        analyst.model.generate_content.assert_not_called()
+    
+    @pytest.mark.parametrize('format, mime_type', [
+        ('PNG', 'image/png'),
+        ('JPEG', 'image/jpeg'),
+    ])
+    def test_image_part_carries_raw_bytes(self, analyst, format, mime_type):
+        """Test Gemini receives the raw bytes labelled with the detected MIME type"""
+        data = make_image((10, 10), format=format)
+        
+        analyst.analyze_floor_plan(image_bytes=data)
+        
+        prompt, image_part = analyst.model.generate_content.call_args.args[0]
+        assert image_part == {'mime_type': mime_type, 'data': data}
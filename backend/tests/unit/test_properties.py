@@ -7,6 +7,9 @@ import io
 from app import create_app
 from unittest.mock import Mock, patch, MagicMock
 
+PROPERTY_ID = '3f6c1a52-8a0e-4c1b-9d2e-7b5f0c9e4a11'
+MISSING_PROPERTY_ID = '00000000-0000-4000-8000-000000000000'
+
 
 @pytest.fixture
 def client():
@@ -248,6 +251,24 @@ class TestListProperties:
             )
             
             assert response.status_code == 200
+    
+    def test_list_limit_capped(self, client, auth_token):
+        """Test oversized page requests are clamped to MAX_PAGE_SIZE rows"""
+        with patch('app.routes.properties.get_db') as mock_db, \
+             patch('app.routes.properties.get_admin_db'):
+            mock_result = Mock()
+            mock_result.data = []
+            
+            mock_query = mock_db.return_value.table.return_value.select.return_value.eq.return_value
+            mock_query.range.return_value.execute.return_value = mock_result
+            
+            response = client.get(
+                '/api/properties/?limit=100000&offset=200',
+                headers={'Authorization': f'Bearer {auth_token}'}
+            )
+            
+            assert response.status_code == 200
+            mock_query.range.assert_called_once_with(200, 299)
 
 
 class TestGetProperty:
@@ -258,7 +279,7 @@ class TestGetProperty:
         with patch('app.routes.properties.get_db') as mock_db:
             mock_result = Mock()
             mock_result.data = [{
-                'id': 'property-123',
+                'id': PROPERTY_ID,
                 'address': '123 Main St',
                 'status': 'complete',
                 'floor_plan_data': {'rooms': 3}
@@ -267,13 +288,13 @@ class TestGetProperty:
             mock_db.return_value.table.return_value.select.return_value.eq.return_value.eq.return_value.execute.return_value = mock_result
             
             response = client.get(
-                '/api/properties/property-123',
+                f'/api/properties/{PROPERTY_ID}',
                 headers={'Authorization': f'Bearer {auth_token}'}
             )
             
             assert response.status_code == 200
             json_data = response.get_json()
-            assert json_data['property']['id'] == 'property-123'
+            assert json_data['property']['id'] == PROPERTY_ID
     
     def test_get_not_found(self, client, auth_token):
         """Test getting non-existent property"""
@@ -284,11 +305,40 @@ class TestGetProperty:
             mock_db.return_value.table.return_value.select.return_value.eq.return_value.eq.return_value.execute.return_value = mock_result
             
             response = client.get(
-                '/api/properties/nonexistent',
+                f'/api/properties/{MISSING_PROPERTY_ID}',
                 headers={'Authorization': f'Bearer {auth_token}'}
             )
             
             assert response.status_code == 404
+    
+    def test_get_invalid_id(self, client, auth_token):
+        """Test malformed property IDs are rejected without querying the database"""
+        with patch('app.routes.properties.get_db') as mock_db:
+            response = client.get(
+                '/api/properties/not-a-uuid',
+                headers={'Authorization': f'Bearer {auth_token}'}
+            )
+            
+            assert response.status_code == 400
+            assert response.get_json()['error'] == 'Invalid property ID'
+            mock_db.assert_not_called()
+    
+    def test_get_non_canonical_id(self, client, auth_token):
+        """Test alternate UUID spellings are queried in canonical form"""
+        with patch('app.routes.properties.get_db') as mock_db:
+            mock_result = Mock()
+            mock_result.data = [{'id': PROPERTY_ID, 'status': 'complete'}]
+            
+            mock_select = mock_db.return_value.table.return_value.select.return_value
+            mock_select.eq.return_value.eq.return_value.execute.return_value = mock_result
+            
+            response = client.get(
+                f'/api/properties/urn:uuid:{PROPERTY_ID.upper()}',
+                headers={'Authorization': f'Bearer {auth_token}'}
+            )
+            
+            assert response.status_code == 200
+            mock_select.eq.assert_called_once_with('id', PROPERTY_ID)
 
 
 class TestDeleteProperty:
@@ -302,7 +352,7 @@ class TestDeleteProperty:
             # Mock get property
             mock_result = Mock()
             mock_result.data = [{
-                'id': 'property-123',
+                'id': PROPERTY_ID,
                 'floor_plan_path': 'user/floor-plan.png'
             }]
             mock_db.return_value.table.return_value.select.return_value.eq.return_value.eq.return_value.execute.return_value = mock_result
@@ -315,13 +365,14 @@ class TestDeleteProperty:
             mock_admin.return_value.table.return_value.delete.return_value.eq.return_value.eq.return_value.execute.return_value = None
             
             response = client.delete(
-                '/api/properties/property-123',
+                f'/api/properties/{PROPERTY_ID}',
                 headers={'Authorization': f'Bearer {auth_token}'}
             )
             
             assert response.status_code == 200
             json_data = response.get_json()
             assert 'deleted' in json_data['message'].lower()
+            mock_db.return_value.table.return_value.select.assert_called_once_with('id, image_storage_path')
     
     def test_delete_not_found(self, client, auth_token):
         """Test deleting non-existent property"""
@@ -332,11 +383,22 @@ class TestDeleteProperty:
             mock_db.return_value.table.return_value.select.return_value.eq.return_value.eq.return_value.execute.return_value = mock_result
             
             response = client.delete(
-                '/api/properties/nonexistent',
+                f'/api/properties/{MISSING_PROPERTY_ID}',
                 headers={'Authorization': f'Bearer {auth_token}'}
             )
             
             assert response.status_code == 404
+    
+    def test_delete_invalid_id(self, client, auth_token):
+        """Test malformed property IDs are rejected without querying the database"""
+        with patch('app.routes.properties.get_db') as mock_db:
+            response = client.delete(
+                '/api/properties/not-a-uuid',
+                headers={'Authorization': f'Bearer {auth_token}'}
+            )
+            
+            assert response.status_code == 400
+            mock_db.assert_not_called()
 
 
 class TestAuthentication: